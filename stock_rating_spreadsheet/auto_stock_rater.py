@@ -7,78 +7,202 @@ Fetches real-time data and calculates scores automatically
 import yfinance as yf
 import pandas as pd
 import numpy as np
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import json
-import csv
-from typing import Dict, List, Tuple
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Union
 import warnings
-warnings.filterwarnings('ignore')
+
+from dashboard_generator import generate_alerts
+
+SEPARATOR = "=" * 80
+SUBSEPARATOR = "-" * 80
+
+# Concurrent Yahoo Finance requests; fetching is network bound, but keep it polite
+FETCH_WORKERS = 8
+
+# Stock data fields read from yfinance's info dict: (field, info key, default, divisor or None)
+INFO_FIELDS = (
+    ('market_cap', 'marketCap', 0, 1e9),  # in billions
+    ('forward_pe', 'forwardPE', None, None),
+    ('trailing_pe', 'trailingPE', None, None),
+    ('peg_ratio', 'pegRatio', None, None),
+    ('price_to_sales', 'priceToSalesTrailing12Months', None, None),
+    ('revenue_growth', 'revenueGrowth', None, None),
+    ('earnings_growth', 'earningsGrowth', None, None),
+    ('operating_margins', 'operatingMargins', None, None),
+    ('profit_margins', 'profitMargins', None, None),
+    ('gross_margins', 'grossMargins', None, None),
+    ('roe', 'returnOnEquity', None, None),
+    ('roa', 'returnOnAssets', None, None),
+    ('free_cash_flow', 'freeCashflow', 0, 1e9),  # in billions
+    ('total_cash', 'totalCash', 0, 1e9),
+    ('total_debt', 'totalDebt', 0, 1e9),
+    ('revenue', 'totalRevenue', 0, 1e9),
+    ('beta', 'beta', 1.0, None),
+    ('fifty_day_avg', 'fiftyDayAverage', 0, None),
+    ('two_hundred_day_avg', 'twoHundredDayAverage', 0, None),
+    ('sector', 'sector', 'Unknown', None),
+    ('industry', 'industry', 'Unknown', None),
+)
+
+# Price return fields and their lookback in trading days
+RETURN_LOOKBACKS = (('return_12m', 252), ('return_6m', 126), ('return_3m', 63))
+
+# Moving average fields and their window in trading days
+MOVING_AVERAGES = (('fifty_day_avg', 50), ('two_hundred_day_avg', 200))
+
+# Calendar days of price history to fetch: covers the longest lookback plus holidays
+HISTORY_DAYS = 400
+
+# Benchmark for relative strength
+BENCHMARK_SYMBOL = 'QQQ'
+
+# On-disk cache of Yahoo Finance responses, with time-to-live in seconds
+CACHE_DIR = ".cache"
+INFO_TTL = 24 * 60 * 60
+HISTORY_TTL = 60 * 60
+
+
+class ScoreTable(NamedTuple):
+    """Step-function score lookup (thresholds ascending, one more score than thresholds)"""
+    thresholds: Tuple[float, ...]
+    scores: Tuple  # scores, or rating labels for the rating tables
+    side: str  # 'left': value must exceed a threshold to move up, 'right': reaching it is enough
+
+
+# Tier 1 score tables, mirroring the Tier1Scorer.score_* ladders
+PE_TABLE = ScoreTable((15, 20, 25, 30, 40), (100, 90, 80, 70, 60, 40), 'right')
+FCF_YIELD_TABLE = ScoreTable((0, 2, 4, 6), (20, 40, 60, 80, 100), 'left')
+PEG_TABLE = ScoreTable((1.0, 1.5, 2.0, 2.5), (100, 85, 70, 50, 30), 'right')
+OPERATING_MARGIN_TABLE = ScoreTable((10, 15, 20, 30), (30, 50, 70, 85, 100), 'left')
+ROE_TABLE = ScoreTable((10, 15, 20, 25), (25, 50, 75, 90, 100), 'left')
+REVENUE_GROWTH_TABLE = ScoreTable((5, 10, 15, 20, 25), (15, 35, 55, 75, 90, 100), 'left')
+PRICE_MOMENTUM_TABLE = ScoreTable((-10, 0, 20, 40), (60, 40, 60, 80, 100), 'left')
+RELATIVE_STRENGTH_TABLE = ScoreTable((-15, 0, 15), (30, 50, 75, 100), 'left')
+NET_CASH_TABLE = ScoreTable((-50, 0, 25, 50), (50, 70, 80, 90, 100), 'left')
+
+# Technical setup score, indexed by (price > 200-day MA) * 2 + (price > 50-day MA)
+TECHNICAL_SCORES = (30, 50, 70, 100)
+
+# Tier 2 / Tier 3 score tables
+PRICE_TO_SALES_TABLE = ScoreTable((8, 15, 25), (100, 80, 60, 40), 'right')
+GROSS_MARGIN_TABLE = ScoreTable((30, 45, 60, 75), (40, 60, 75, 90, 100), 'left')
+HIGH_GROWTH_REVENUE_TABLE = ScoreTable((10, 15, 20, 25, 30, 40), (20, 40, 55, 70, 80, 90, 100), 'left')
+HYPERGROWTH_REVENUE_TABLE = ScoreTable((20, 30, 50, 75, 100), (25, 50, 70, 85, 95, 100), 'left')
+
+# Composite weights, in component order
+TIER1_WEIGHTS = (0.20, 0.30, 0.30, 0.10, 0.10)  # Valuation, Quality, Growth, Momentum, Financial Health
+TIER2_WEIGHTS = (0.18, 0.25, 0.35, 0.15, 0.07)  # Valuation, Quality, Growth, Momentum, Scale & Moat
+TIER3_WEIGHTS = (0.10, 0.15, 0.45, 0.20, 0.10)  # Valuation, Quality, Growth, Momentum, Disruption
+
+# Tier 3 stop loss as a fraction of the current price (sell after a 40% drop)
+TIER3_STOP_LOSS_RATIO = 0.6
+
+# Composite score -> rating label
+RATING_TABLE = ScoreTable((50, 65, 75, 85),
+                          ("Sell ⭐", "Reduce ⭐⭐", "Hold ⭐⭐⭐", "Buy ⭐⭐⭐⭐", "Strong Buy ⭐⭐⭐⭐⭐"), 'right')
+TIER3_RATING_TABLE = ScoreTable((65, 75, 85),
+                                ("High Risk ⭐⭐", "Hold ⭐⭐⭐", "Buy ⭐⭐⭐⭐", "Strong Buy ⭐⭐⭐⭐⭐"), 'right')
+
+
+def lookup_score(value: float, table: ScoreTable) -> int:
+    """Score a single metric value against a ScoreTable"""
+    search = bisect_left if table.side == 'left' else bisect_right
+    return table.scores[search(table.thresholds, value)]
+
+
+@lru_cache(maxsize=None)
+def _table_arrays(table: ScoreTable) -> Tuple[np.ndarray, np.ndarray]:
+    """NumPy copies of a ScoreTable's thresholds and scores, built once per table"""
+    return np.asarray(table.thresholds, dtype=float), np.asarray(table.scores)
+
+
+def lookup_scores(values: np.ndarray, table: ScoreTable, missing: int = None) -> np.ndarray:
+    """Score an array of metric values against a ScoreTable in one pass
+
+    If ``missing`` is given, NaN values (metric not available) score ``missing``.
+    """
+    thresholds, scores = _table_arrays(table)
+    result = scores[np.searchsorted(thresholds, values, side=table.side)]
+    if missing is not None:
+        result = np.where(np.isnan(values), missing, result)
+    return result
+
+
+def weighted_composite(components, weights):
+    """Weighted sum of component scores (scalars or arrays)
+
+    Accumulated left to right, so the per-stock and batch paths compute the
+    same unrounded composite and therefore the same rating; the reported
+    scores are then rounded the same way by round_score.
+    """
+    return sum(component * weight for component, weight in zip(components, weights))
+
+
+def round_score(value, decimals: int = 1):
+    """Round a score (scalar or array) for reporting
+
+    Both scoring paths round with np.round, so a stock scored alone and in a
+    batch reports the same values.
+    """
+    return np.round(value, decimals)
+
+
+def _column(df: pd.DataFrame, name: str, default: float = np.nan) -> np.ndarray:
+    """Return a float column from a metrics frame, with missing values as NaN"""
+    if name not in df:
+        return np.full(len(df), default)
+    return pd.to_numeric(df[name], errors='coerce').fillna(default).to_numpy(dtype=float)
 
 
 class StockDataFetcher:
     """Fetches stock data from Yahoo Finance"""
 
-    def __init__(self):
-        self.cache = {}
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache = {}  # in-process copy of the on-disk cache, by file path
+        self.cache_dir = cache_dir
+        self._benchmark_lock = threading.Lock()
+        self._benchmark_fetched = False
+        self._benchmark_return = None
 
     def get_stock_data(self, symbol: str) -> Dict:
         """Fetch comprehensive stock data"""
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            hist = ticker.history(period="2y")
+            info = self.get_info(symbol)
+            hist = self.get_history(symbol)
 
             data = {
                 'symbol': symbol,
                 'price': info.get('currentPrice', info.get('regularMarketPrice', 0)),
-                'market_cap': info.get('marketCap', 0) / 1e9,  # in billions
-                'forward_pe': info.get('forwardPE', None),
-                'trailing_pe': info.get('trailingPE', None),
-                'peg_ratio': info.get('pegRatio', None),
-                'price_to_sales': info.get('priceToSalesTrailing12Months', None),
-                'revenue_growth': info.get('revenueGrowth', None),
-                'earnings_growth': info.get('earningsGrowth', None),
-                'operating_margins': info.get('operatingMargins', None),
-                'profit_margins': info.get('profitMargins', None),
-                'gross_margins': info.get('grossMargins', None),
-                'roe': info.get('returnOnEquity', None),
-                'roa': info.get('returnOnAssets', None),
-                'free_cash_flow': info.get('freeCashflow', 0) / 1e9,  # in billions
-                'total_cash': info.get('totalCash', 0) / 1e9,
-                'total_debt': info.get('totalDebt', 0) / 1e9,
-                'revenue': info.get('totalRevenue', 0) / 1e9,
-                'beta': info.get('beta', 1.0),
-                'fifty_day_avg': info.get('fiftyDayAverage', 0),
-                'two_hundred_day_avg': info.get('twoHundredDayAverage', 0),
-                'sector': info.get('sector', 'Unknown'),
-                'industry': info.get('industry', 'Unknown'),
             }
-
-            # Calculate price returns
-            if len(hist) > 0:
-                current_price = hist['Close'].iloc[-1]
-
-                # 12-month return (excluding last month)
-                if len(hist) >= 252:
-                    price_12m_ago = hist['Close'].iloc[-252]
-                    data['return_12m'] = ((current_price - price_12m_ago) / price_12m_ago) * 100
-
-                # 6-month return
-                if len(hist) >= 126:
-                    price_6m_ago = hist['Close'].iloc[-126]
-                    data['return_6m'] = ((current_price - price_6m_ago) / price_6m_ago) * 100
-
-                # 3-month return
-                if len(hist) >= 63:
-                    price_3m_ago = hist['Close'].iloc[-63]
-                    data['return_3m'] = ((current_price - price_3m_ago) / price_3m_ago) * 100
-
-            # Get benchmark (QQQ) for relative strength
-            qqq = yf.Ticker('QQQ')
-            qqq_hist = qqq.history(period="1y")
-            if len(qqq_hist) >= 252:
-                qqq_return = ((qqq_hist['Close'].iloc[-1] - qqq_hist['Close'].iloc[-252]) /
-                             qqq_hist['Close'].iloc[-252]) * 100
+            for field, key, default, divisor in INFO_FIELDS:
+                value = info.get(key, default)
+                data[field] = value / divisor if divisor else value
+
+            # Calculate price returns for every lookback the history covers, in one pass
+            closes = hist['Close'].to_numpy()
+            available = [(key, days) for key, days in RETURN_LOOKBACKS if len(closes) >= days]
+            if available:
+                past_prices = closes[[-days for _, days in available]]
+                returns = ((closes[-1] - past_prices) / past_prices) * 100
+                data.update(zip((key for key, _ in available), returns))
+
+            # Price and moving averages from the same closes; the info quote is only a fallback
+            if len(closes) > 0:
+                data['price'] = closes[-1]
+            for key, days in MOVING_AVERAGES:
+                if len(closes) >= days:
+                    data[key] = closes[-days:].mean()
+
+            # Benchmark (QQQ) return for relative strength
+            qqq_return = self.get_benchmark_return()
+            if qqq_return is not None:
                 data['qqq_return'] = qqq_return
 
             return data
@@ -87,6 +211,107 @@ class StockDataFetcher:
             print(f"Error fetching data for {symbol}: {e}")
             return None
 
+    def get_info(self, symbol: str) -> Dict:
+        """Ticker info dict, cached on disk for INFO_TTL"""
+        return self._cached(f"{symbol}_info.json", INFO_TTL, lambda: yf.Ticker(symbol).info,
+                            self._load_json, self._dump_json)
+
+    def get_history(self, symbol: str) -> pd.DataFrame:
+        """Daily price history for the last HISTORY_DAYS, cached on disk for HISTORY_TTL"""
+        return self._cached(f"{symbol}_history.pkl", HISTORY_TTL,
+                            lambda: yf.Ticker(symbol).history(start=self._history_start()),
+                            pd.read_pickle, self._dump_pickle)
+
+    def prefetch_history(self, symbols: List[str]):
+        """Download price history for all uncached symbols in one yf.download call
+
+        Each symbol's history is cached as if fetched by get_history, so later
+        get_history calls do not hit the network. Symbols the batch download
+        misses are left for get_history to fetch individually.
+        """
+        missing = [symbol for symbol in symbols
+                   if not self._is_fresh(os.path.join(self.cache_dir, f"{symbol}_history.pkl"), HISTORY_TTL)]
+        if not missing:
+            return
+
+        try:
+            frames = yf.download(missing, start=self._history_start(), group_by='ticker',
+                                 auto_adjust=True, threads=True, progress=False)
+        except Exception as e:
+            print(f"Error downloading price history: {e}")
+            return
+
+        for symbol in missing:
+            if isinstance(frames.columns, pd.MultiIndex):
+                if symbol not in frames.columns.get_level_values(0):
+                    continue
+                hist = frames[symbol]
+            else:
+                hist = frames  # a single ticker comes back without the ticker level
+            hist = hist.dropna(how='all')  # rows other tickers traded but this one did not
+            if len(hist) > 0:
+                self._store(os.path.join(self.cache_dir, f"{symbol}_history.pkl"), hist, self._dump_pickle)
+
+    @staticmethod
+    def _history_start() -> str:
+        return (datetime.now() - timedelta(days=HISTORY_DAYS)).strftime('%Y-%m-%d')
+
+    def _cached(self, filename: str, ttl: float, fetch, load, dump):
+        """Return the cached value for filename if younger than ttl, else fetch and store it"""
+        path = os.path.join(self.cache_dir, filename)
+        if path in self.cache:
+            return self.cache[path]
+
+        if self._is_fresh(path, ttl):
+            self.cache[path] = load(path)
+            return self.cache[path]
+
+        return self._store(path, fetch(), dump)
+
+    @staticmethod
+    def _is_fresh(path: str, ttl: float) -> bool:
+        return os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl
+
+    def _store(self, path: str, value, dump):
+        """Write value to the disk cache and keep it in memory"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        dump(value, path + ".tmp")
+        os.replace(path + ".tmp", path)  # never leave a half-written cache file
+        self.cache[path] = value
+        return value
+
+    @staticmethod
+    def _load_json(path: str) -> Dict:
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _dump_json(value: Dict, path: str):
+        with open(path, 'w') as f:
+            json.dump(value, f, default=str)
+
+    @staticmethod
+    def _dump_pickle(value: pd.DataFrame, path: str):
+        value.to_pickle(path)
+
+    def get_benchmark_return(self) -> float:
+        """12-month QQQ return (%), fetched once per fetcher; None if history is too short"""
+        with self._benchmark_lock:  # get_many calls this from several threads
+            if not self._benchmark_fetched:
+                qqq_hist = self.get_history(BENCHMARK_SYMBOL)
+                if len(qqq_hist) >= 252:
+                    self._benchmark_return = ((qqq_hist['Close'].iloc[-1] - qqq_hist['Close'].iloc[-252]) /
+                                              qqq_hist['Close'].iloc[-252]) * 100
+                self._benchmark_fetched = True
+            return self._benchmark_return
+
+    def get_many(self, symbols: Iterable[str]) -> Dict[str, Dict]:
+        """Fetch several symbols concurrently, returning {symbol: data} (None for failures)"""
+        symbols = list(dict.fromkeys(symbols))  # drop duplicates, keep order
+        self.prefetch_history(list(dict.fromkeys(symbols + [BENCHMARK_SYMBOL])))
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            return dict(zip(symbols, pool.map(self.get_stock_data, symbols)))
+
 
 class Tier1Scorer:
     """Score stocks for Tier 1 (Core)"""
@@ -99,18 +324,7 @@ class Tier1Scorer:
 
         # If no historical average, use general thresholds
         if historical_avg_pe is None:
-            if forward_pe < 15:
-                return 100
-            elif forward_pe < 20:
-                return 90
-            elif forward_pe < 25:
-                return 80
-            elif forward_pe < 30:
-                return 70
-            elif forward_pe < 40:
-                return 60
-            else:
-                return 40
+            return lookup_score(forward_pe, PE_TABLE)
 
         # Compare to historical average
         ratio = forward_pe / historical_avg_pe
@@ -130,16 +344,7 @@ class Tier1Scorer:
 
         fcf_yield = (fcf / market_cap) * 100
 
-        if fcf_yield > 6:
-            return 100
-        elif fcf_yield > 4:
-            return 80
-        elif fcf_yield > 2:
-            return 60
-        elif fcf_yield > 0:
-            return 40
-        else:
-            return 20
+        return lookup_score(fcf_yield, FCF_YIELD_TABLE)
 
     @staticmethod
     def score_peg_ratio(peg: float) -> int:
@@ -147,16 +352,7 @@ class Tier1Scorer:
         if peg is None:
             return 50
 
-        if peg < 1.0:
-            return 100
-        elif peg < 1.5:
-            return 85
-        elif peg < 2.0:
-            return 70
-        elif peg < 2.5:
-            return 50
-        else:
-            return 30
+        return lookup_score(peg, PEG_TABLE)
 
     @staticmethod
     def score_operating_margin(margin: float) -> int:
@@ -164,18 +360,7 @@ class Tier1Scorer:
         if margin is None:
             return 50
 
-        margin_pct = margin * 100
-
-        if margin_pct > 30:
-            return 100
-        elif margin_pct > 20:
-            return 85
-        elif margin_pct > 15:
-            return 70
-        elif margin_pct > 10:
-            return 50
-        else:
-            return 30
+        return lookup_score(margin * 100, OPERATING_MARGIN_TABLE)
 
     @staticmethod
     def score_roe(roe: float) -> int:
@@ -183,18 +368,7 @@ class Tier1Scorer:
         if roe is None:
             return 50
 
-        roe_pct = roe * 100
-
-        if roe_pct > 25:
-            return 100
-        elif roe_pct > 20:
-            return 90
-        elif roe_pct > 15:
-            return 75
-        elif roe_pct > 10:
-            return 50
-        else:
-            return 25
+        return lookup_score(roe * 100, ROE_TABLE)
 
     @staticmethod
     def score_revenue_growth(growth: float) -> int:
@@ -202,20 +376,7 @@ class Tier1Scorer:
         if growth is None:
             return 50
 
-        growth_pct = growth * 100
-
-        if growth_pct > 25:
-            return 100
-        elif growth_pct > 20:
-            return 90
-        elif growth_pct > 15:
-            return 75
-        elif growth_pct > 10:
-            return 55
-        elif growth_pct > 5:
-            return 35
-        else:
-            return 15
+        return lookup_score(growth * 100, REVENUE_GROWTH_TABLE)
 
     @staticmethod
     def score_price_momentum(return_12m: float) -> int:
@@ -223,16 +384,8 @@ class Tier1Scorer:
         if return_12m is None:
             return 50
 
-        if return_12m > 40:
-            return 100
-        elif return_12m > 20:
-            return 80
-        elif return_12m > 0:
-            return 60
-        elif return_12m > -10:
-            return 40
-        else:
-            return 60  # Potential reversal
+        # Deep drawdowns score back up to 60 (potential reversal)
+        return lookup_score(return_12m, PRICE_MOMENTUM_TABLE)
 
     @staticmethod
     def score_relative_strength(stock_return: float, benchmark_return: float) -> int:
@@ -242,14 +395,7 @@ class Tier1Scorer:
 
         outperformance = stock_return - benchmark_return
 
-        if outperformance > 15:
-            return 100
-        elif outperformance > 0:
-            return 75
-        elif outperformance > -15:
-            return 50
-        else:
-            return 30
+        return lookup_score(outperformance, RELATIVE_STRENGTH_TABLE)
 
     @staticmethod
     def score_technical(price: float, ma_50: float, ma_200: float) -> int:
@@ -257,94 +403,69 @@ class Tier1Scorer:
         if price == 0 or ma_200 == 0:
             return 50
 
-        above_200 = price > ma_200
-        above_50 = price > ma_50
-
-        if above_50 and above_200:
-            return 100
-        elif above_200:
-            return 70
-        elif above_50:
-            return 50
-        else:
-            return 30
+        return TECHNICAL_SCORES[(price > ma_200) * 2 + (price > ma_50)]
 
     @staticmethod
     def score_net_cash(total_cash: float, total_debt: float, market_cap: float) -> int:
         """Score net cash position (0-100)"""
         net_cash = total_cash - total_debt
 
-        if net_cash > 50:
-            return 100
-        elif net_cash > 25:
-            return 90
-        elif net_cash > 0:
-            return 80
-        elif net_cash > -50:
-            return 70
-        else:
-            return 50
+        return lookup_score(net_cash, NET_CASH_TABLE)
 
     @classmethod
     def calculate_composite_score(cls, data: Dict) -> Dict:
         """Calculate all component scores and composite"""
 
+        # Read each input once; several feed more than one component
+        market_cap = data.get('market_cap', 1)
+        free_cash_flow = data.get('free_cash_flow', 0)
+        revenue_growth = data.get('revenue_growth')
+        return_12m = data.get('return_12m')
+
         # Valuation (20%)
         pe_score = cls.score_pe_ratio(data.get('forward_pe'))
-        fcf_yield_score = cls.score_fcf_yield(data.get('free_cash_flow', 0), data.get('market_cap', 1))
+        fcf_yield_score = cls.score_fcf_yield(free_cash_flow, market_cap)
         peg_score = cls.score_peg_ratio(data.get('peg_ratio'))
-        valuation_avg = np.mean([pe_score, fcf_yield_score, peg_score])
+        valuation_avg = (pe_score + fcf_yield_score + peg_score) / 3
 
         # Quality (30%)
         roe_score = cls.score_roe(data.get('roe'))
         margin_score = cls.score_operating_margin(data.get('operating_margins'))
         moat_score = 70  # Default, needs manual assessment
-        quality_avg = np.mean([roe_score, margin_score, moat_score])
+        quality_avg = (roe_score + margin_score + moat_score) / 3
 
         # Growth (30%)
-        revenue_growth_score = cls.score_revenue_growth(data.get('revenue_growth'))
-        earnings_growth_score = cls.score_revenue_growth(data.get('earnings_growth', data.get('revenue_growth')))
-        growth_avg = np.mean([revenue_growth_score, earnings_growth_score])
+        revenue_growth_score = cls.score_revenue_growth(revenue_growth)
+        earnings_growth_score = cls.score_revenue_growth(data.get('earnings_growth', revenue_growth))
+        growth_avg = (revenue_growth_score + earnings_growth_score) / 2
 
         # Momentum (10%)
-        momentum_score = cls.score_price_momentum(data.get('return_12m'))
-        rel_strength_score = cls.score_relative_strength(data.get('return_12m'), data.get('qqq_return', 0))
+        momentum_score = cls.score_price_momentum(return_12m)
+        rel_strength_score = cls.score_relative_strength(return_12m, data.get('qqq_return', 0))
         technical_score = cls.score_technical(data.get('price', 0), data.get('fifty_day_avg', 0),
                                               data.get('two_hundred_day_avg', 0))
-        momentum_avg = np.mean([momentum_score, rel_strength_score, technical_score])
+        momentum_avg = (momentum_score + rel_strength_score + technical_score) / 3
 
         # Financial Health (10%)
         net_cash_score = cls.score_net_cash(data.get('total_cash', 0), data.get('total_debt', 0),
-                                            data.get('market_cap', 1))
-        fcf_gen_score = 100 if data.get('free_cash_flow', 0) > 15 else 70
-        financial_health_avg = np.mean([net_cash_score, fcf_gen_score])
+                                            market_cap)
+        fcf_gen_score = 100 if free_cash_flow > 15 else 70
+        financial_health_avg = (net_cash_score + fcf_gen_score) / 2
 
         # Composite Score (weighted average)
-        composite = (valuation_avg * 0.20 +
-                    quality_avg * 0.30 +
-                    growth_avg * 0.30 +
-                    momentum_avg * 0.10 +
-                    financial_health_avg * 0.10)
+        composite = weighted_composite((valuation_avg, quality_avg, growth_avg,
+                                        momentum_avg, financial_health_avg), TIER1_WEIGHTS)
 
         # Rating
-        if composite >= 85:
-            rating = "Strong Buy ⭐⭐⭐⭐⭐"
-        elif composite >= 75:
-            rating = "Buy ⭐⭐⭐⭐"
-        elif composite >= 65:
-            rating = "Hold ⭐⭐⭐"
-        elif composite >= 50:
-            rating = "Reduce ⭐⭐"
-        else:
-            rating = "Sell ⭐"
+        rating = lookup_score(composite, RATING_TABLE)
 
         return {
-            'valuation_score': round(valuation_avg, 1),
-            'quality_score': round(quality_avg, 1),
-            'growth_score': round(growth_avg, 1),
-            'momentum_score': round(momentum_avg, 1),
-            'financial_health_score': round(financial_health_avg, 1),
-            'composite_score': round(composite, 1),
+            'valuation_score': round_score(valuation_avg, 1),
+            'quality_score': round_score(quality_avg, 1),
+            'growth_score': round_score(growth_avg, 1),
+            'momentum_score': round_score(momentum_avg, 1),
+            'financial_health_score': round_score(financial_health_avg, 1),
+            'composite_score': round_score(composite, 1),
             'rating': rating,
             'pe_score': pe_score,
             'fcf_yield_score': fcf_yield_score,
@@ -357,6 +478,84 @@ class Tier1Scorer:
             'technical_score': technical_score,
         }
 
+    @staticmethod
+    def calculate_composite_scores(data: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> pd.DataFrame:
+        """Vectorized calculate_composite_score over many stocks
+
+        Accepts a DataFrame with one row per stock or a dict of equal-length
+        metric arrays (same keys as get_stock_data).
+        """
+        df = pd.DataFrame(data)
+        forward_pe = _column(df, 'forward_pe')
+        market_cap = _column(df, 'market_cap', 0)
+        free_cash_flow = _column(df, 'free_cash_flow', 0)
+        peg_ratio = _column(df, 'peg_ratio')
+        roe = _column(df, 'roe')
+        operating_margins = _column(df, 'operating_margins')
+        revenue_growth = _column(df, 'revenue_growth')
+        earnings_growth = (_column(df, 'earnings_growth') if 'earnings_growth' in df
+                           else revenue_growth)
+        return_12m = _column(df, 'return_12m')
+        qqq_return = _column(df, 'qqq_return', 0)
+        price = _column(df, 'price', 0)
+        ma_50 = _column(df, 'fifty_day_avg', 0)
+        ma_200 = _column(df, 'two_hundred_day_avg', 0)
+        net_cash = _column(df, 'total_cash', 0) - _column(df, 'total_debt', 0)
+
+        # Valuation (20%)
+        pe_score = np.where(forward_pe <= 0, 50, lookup_scores(forward_pe, PE_TABLE, missing=50))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fcf_yield = free_cash_flow / market_cap * 100
+        fcf_yield_score = np.where((market_cap == 0) | (free_cash_flow <= 0), 20,
+                                   lookup_scores(fcf_yield, FCF_YIELD_TABLE))
+        peg_score = lookup_scores(peg_ratio, PEG_TABLE, missing=50)
+        valuation_avg = (pe_score + fcf_yield_score + peg_score) / 3
+
+        # Quality (30%)
+        roe_score = lookup_scores(roe * 100, ROE_TABLE, missing=50)
+        margin_score = lookup_scores(operating_margins * 100, OPERATING_MARGIN_TABLE, missing=50)
+        moat_score = 70  # Default, needs manual assessment
+        quality_avg = (roe_score + margin_score + moat_score) / 3
+
+        # Growth (30%)
+        revenue_growth_score = lookup_scores(revenue_growth * 100, REVENUE_GROWTH_TABLE, missing=50)
+        earnings_growth_score = lookup_scores(earnings_growth * 100, REVENUE_GROWTH_TABLE, missing=50)
+        growth_avg = (revenue_growth_score + earnings_growth_score) / 2
+
+        # Momentum (10%)
+        momentum_score = lookup_scores(return_12m, PRICE_MOMENTUM_TABLE, missing=50)
+        rel_strength_score = lookup_scores(return_12m - qqq_return, RELATIVE_STRENGTH_TABLE, missing=50)
+        technical_score = np.where((price == 0) | (ma_200 == 0), 50,
+                                   np.asarray(TECHNICAL_SCORES)[(price > ma_200) * 2 + (price > ma_50)])
+        momentum_avg = (momentum_score + rel_strength_score + technical_score) / 3
+
+        # Financial Health (10%)
+        net_cash_score = lookup_scores(net_cash, NET_CASH_TABLE)
+        fcf_gen_score = np.where(free_cash_flow > 15, 100, 70)
+        financial_health_avg = (net_cash_score + fcf_gen_score) / 2
+
+        composite = weighted_composite((valuation_avg, quality_avg, growth_avg,
+                                        momentum_avg, financial_health_avg), TIER1_WEIGHTS)
+
+        return pd.DataFrame({
+            'valuation_score': round_score(valuation_avg, 1),
+            'quality_score': round_score(quality_avg, 1),
+            'growth_score': round_score(growth_avg, 1),
+            'momentum_score': round_score(momentum_avg, 1),
+            'financial_health_score': round_score(financial_health_avg, 1),
+            'composite_score': round_score(composite, 1),
+            'rating': lookup_scores(composite, RATING_TABLE),
+            'pe_score': pe_score,
+            'fcf_yield_score': fcf_yield_score,
+            'peg_score': peg_score,
+            'roe_score': roe_score,
+            'margin_score': margin_score,
+            'revenue_growth_score': revenue_growth_score,
+            'momentum_raw_score': momentum_score,
+            'relative_strength_score': rel_strength_score,
+            'technical_score': technical_score,
+        }, index=df.index)
+
 
 class Tier2Scorer:
     """Score stocks for Tier 2 (Emerging)"""
@@ -367,14 +566,7 @@ class Tier2Scorer:
         if ps_ratio is None:
             return 50
 
-        if ps_ratio < 8:
-            return 100
-        elif ps_ratio < 15:
-            return 80
-        elif ps_ratio < 25:
-            return 60
-        else:
-            return 40
+        return lookup_score(ps_ratio, PRICE_TO_SALES_TABLE)
 
     @staticmethod
     def score_gross_margin(margin: float) -> int:
@@ -382,18 +574,7 @@ class Tier2Scorer:
         if margin is None:
             return 50
 
-        margin_pct = margin * 100
-
-        if margin_pct > 75:
-            return 100
-        elif margin_pct > 60:
-            return 90
-        elif margin_pct > 45:
-            return 75
-        elif margin_pct > 30:
-            return 60
-        else:
-            return 40
+        return lookup_score(margin * 100, GROSS_MARGIN_TABLE)
 
     @staticmethod
     def score_high_growth_revenue(growth: float) -> int:
@@ -401,80 +582,103 @@ class Tier2Scorer:
         if growth is None:
             return 50
 
-        growth_pct = growth * 100
-
-        if growth_pct > 40:
-            return 100
-        elif growth_pct > 30:
-            return 90
-        elif growth_pct > 25:
-            return 80
-        elif growth_pct > 20:
-            return 70
-        elif growth_pct > 15:
-            return 55
-        elif growth_pct > 10:
-            return 40
-        else:
-            return 20
+        return lookup_score(growth * 100, HIGH_GROWTH_REVENUE_TABLE)
 
     @classmethod
     def calculate_composite_score(cls, data: Dict) -> Dict:
         """Calculate all component scores for Tier 2"""
 
+        # Read once; feeds both momentum components
+        return_6m = data.get('return_6m')
+
         # Valuation (18%)
         ps_score = cls.score_price_to_sales(data.get('price_to_sales'))
         peg_score = Tier1Scorer.score_peg_ratio(data.get('peg_ratio'))
-        valuation_avg = np.mean([ps_score, peg_score])
+        valuation_avg = (ps_score + peg_score) / 2
 
         # Quality (25%)
         revenue_size_score = 85 if data.get('revenue', 0) > 2 else 70
         gross_margin_score = cls.score_gross_margin(data.get('gross_margins'))
         margin_score = Tier1Scorer.score_operating_margin(data.get('operating_margins'))
-        quality_avg = np.mean([revenue_size_score, gross_margin_score, margin_score])
+        quality_avg = (revenue_size_score + gross_margin_score + margin_score) / 3
 
         # Growth (35%) - HIGHEST WEIGHT
         revenue_growth_score = cls.score_high_growth_revenue(data.get('revenue_growth'))
         tam_score = 85  # Default, needs manual assessment
-        growth_avg = np.mean([revenue_growth_score, tam_score])
+        growth_avg = (revenue_growth_score + tam_score) / 2
 
         # Momentum (15%)
-        momentum_score = Tier1Scorer.score_price_momentum(data.get('return_6m', data.get('return_12m')))
-        rel_strength_score = Tier1Scorer.score_relative_strength(data.get('return_6m'), data.get('qqq_return', 0))
-        momentum_avg = np.mean([momentum_score, rel_strength_score])
+        momentum_return = return_6m if 'return_6m' in data else data.get('return_12m')
+        momentum_score = Tier1Scorer.score_price_momentum(momentum_return)
+        rel_strength_score = Tier1Scorer.score_relative_strength(return_6m, data.get('qqq_return', 0))
+        momentum_avg = (momentum_score + rel_strength_score) / 2
 
         # Scale & Moat (7%)
         moat_score = 75  # Default
 
         # Composite Score
-        composite = (valuation_avg * 0.18 +
-                    quality_avg * 0.25 +
-                    growth_avg * 0.35 +
-                    momentum_avg * 0.15 +
-                    moat_score * 0.07)
+        composite = weighted_composite((valuation_avg, quality_avg, growth_avg,
+                                        momentum_avg, moat_score), TIER2_WEIGHTS)
 
         # Rating
-        if composite >= 85:
-            rating = "Strong Buy ⭐⭐⭐⭐⭐"
-        elif composite >= 75:
-            rating = "Buy ⭐⭐⭐⭐"
-        elif composite >= 65:
-            rating = "Hold ⭐⭐⭐"
-        elif composite >= 50:
-            rating = "Reduce ⭐⭐"
-        else:
-            rating = "Sell ⭐"
+        rating = lookup_score(composite, RATING_TABLE)
 
         return {
-            'valuation_score': round(valuation_avg, 1),
-            'quality_score': round(quality_avg, 1),
-            'growth_score': round(growth_avg, 1),
-            'momentum_score': round(momentum_avg, 1),
+            'valuation_score': round_score(valuation_avg, 1),
+            'quality_score': round_score(quality_avg, 1),
+            'growth_score': round_score(growth_avg, 1),
+            'momentum_score': round_score(momentum_avg, 1),
             'moat_score': moat_score,
-            'composite_score': round(composite, 1),
+            'composite_score': round_score(composite, 1),
             'rating': rating,
         }
 
+    @staticmethod
+    def calculate_composite_scores(data: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> pd.DataFrame:
+        """Vectorized calculate_composite_score over many stocks (see Tier1Scorer.calculate_composite_scores)"""
+        df = pd.DataFrame(data)
+        return_6m = _column(df, 'return_6m')
+
+        # Valuation (18%)
+        ps_score = lookup_scores(_column(df, 'price_to_sales'), PRICE_TO_SALES_TABLE, missing=50)
+        peg_score = lookup_scores(_column(df, 'peg_ratio'), PEG_TABLE, missing=50)
+        valuation_avg = (ps_score + peg_score) / 2
+
+        # Quality (25%)
+        revenue_size_score = np.where(_column(df, 'revenue', 0) > 2, 85, 70)
+        gross_margin_score = lookup_scores(_column(df, 'gross_margins') * 100, GROSS_MARGIN_TABLE, missing=50)
+        margin_score = lookup_scores(_column(df, 'operating_margins') * 100, OPERATING_MARGIN_TABLE, missing=50)
+        quality_avg = (revenue_size_score + gross_margin_score + margin_score) / 3
+
+        # Growth (35%) - HIGHEST WEIGHT
+        revenue_growth_score = lookup_scores(_column(df, 'revenue_growth') * 100, HIGH_GROWTH_REVENUE_TABLE,
+                                             missing=50)
+        tam_score = 85  # Default, needs manual assessment
+        growth_avg = (revenue_growth_score + tam_score) / 2
+
+        # Momentum (15%), falling back to the 12-month return when there is no 6-month history
+        momentum_return = np.where(np.isnan(return_6m), _column(df, 'return_12m'), return_6m)
+        momentum_score = lookup_scores(momentum_return, PRICE_MOMENTUM_TABLE, missing=50)
+        rel_strength_score = lookup_scores(return_6m - _column(df, 'qqq_return', 0), RELATIVE_STRENGTH_TABLE,
+                                           missing=50)
+        momentum_avg = (momentum_score + rel_strength_score) / 2
+
+        # Scale & Moat (7%)
+        moat_score = 75  # Default
+
+        composite = weighted_composite((valuation_avg, quality_avg, growth_avg,
+                                        momentum_avg, moat_score), TIER2_WEIGHTS)
+
+        return pd.DataFrame({
+            'valuation_score': round_score(valuation_avg, 1),
+            'quality_score': round_score(quality_avg, 1),
+            'growth_score': round_score(growth_avg, 1),
+            'momentum_score': round_score(momentum_avg, 1),
+            'moat_score': moat_score,
+            'composite_score': round_score(composite, 1),
+            'rating': lookup_scores(composite, RATING_TABLE),
+        }, index=df.index)
+
 
 class Tier3Scorer:
     """Score stocks for Tier 3 (Moonshots)"""
@@ -485,20 +689,7 @@ class Tier3Scorer:
         if growth is None:
             return 50
 
-        growth_pct = growth * 100
-
-        if growth_pct > 100:
-            return 100
-        elif growth_pct > 75:
-            return 95
-        elif growth_pct > 50:
-            return 85
-        elif growth_pct > 30:
-            return 70
-        elif growth_pct > 20:
-            return 50
-        else:
-            return 25
+        return lookup_score(growth * 100, HYPERGROWTH_REVENUE_TABLE)
 
     @classmethod
     def calculate_composite_score(cls, data: Dict) -> Dict:
@@ -515,7 +706,7 @@ class Tier3Scorer:
         # Growth (45%) - HIGHEST WEIGHT
         revenue_growth_score = cls.score_hypergrowth_revenue(data.get('revenue_growth'))
         tam_score = 90  # Default for moonshots
-        growth_avg = np.mean([revenue_growth_score, tam_score])
+        growth_avg = (revenue_growth_score + tam_score) / 2
 
         # Momentum (20%)
         momentum_score = 90 if data.get('return_6m', 0) > 50 else 70
@@ -524,36 +715,115 @@ class Tier3Scorer:
         disruption_score = 80  # Default, needs manual assessment
 
         # Composite Score
-        composite = (valuation_avg * 0.10 +
-                    quality_avg * 0.15 +
-                    growth_avg * 0.45 +
-                    momentum_score * 0.20 +
-                    disruption_score * 0.10)
+        composite = weighted_composite((valuation_avg, quality_avg, growth_avg,
+                                        momentum_score, disruption_score), TIER3_WEIGHTS)
 
         # Rating
-        if composite >= 85:
-            rating = "Strong Buy ⭐⭐⭐⭐⭐"
-        elif composite >= 75:
-            rating = "Buy ⭐⭐⭐⭐"
-        elif composite >= 65:
-            rating = "Hold ⭐⭐⭐"
-        else:
-            rating = "High Risk ⭐⭐"
+        rating = lookup_score(composite, TIER3_RATING_TABLE)
 
         # Calculate stop loss
-        stop_loss_price = data.get('price', 0) * 0.6
+        stop_loss_price = data.get('price', 0) * TIER3_STOP_LOSS_RATIO
 
         return {
-            'valuation_score': round(valuation_avg, 1),
-            'quality_score': round(quality_avg, 1),
-            'growth_score': round(growth_avg, 1),
+            'valuation_score': round_score(valuation_avg, 1),
+            'quality_score': round_score(quality_avg, 1),
+            'growth_score': round_score(growth_avg, 1),
             'momentum_score': momentum_score,
             'disruption_score': disruption_score,
-            'composite_score': round(composite, 1),
+            'composite_score': round_score(composite, 1),
             'rating': rating,
-            'stop_loss_price': round(stop_loss_price, 2),
+            'stop_loss_price': round_score(stop_loss_price, 2),
         }
 
+    @staticmethod
+    def calculate_composite_scores(data: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> pd.DataFrame:
+        """Vectorized calculate_composite_score over many stocks (see Tier1Scorer.calculate_composite_scores)"""
+        df = pd.DataFrame(data)
+
+        # Valuation (10%) - LOWEST WEIGHT
+        valuation_avg = lookup_scores(_column(df, 'price_to_sales'), PRICE_TO_SALES_TABLE, missing=50)
+
+        # Quality (15%)
+        quality_avg = lookup_scores(_column(df, 'gross_margins') * 100, GROSS_MARGIN_TABLE, missing=50)
+
+        # Growth (45%) - HIGHEST WEIGHT
+        revenue_growth_score = lookup_scores(_column(df, 'revenue_growth') * 100, HYPERGROWTH_REVENUE_TABLE,
+                                             missing=50)
+        tam_score = 90  # Default for moonshots
+        growth_avg = (revenue_growth_score + tam_score) / 2
+
+        # Momentum (20%)
+        momentum_score = np.where(_column(df, 'return_6m', 0) > 50, 90, 70)
+
+        # Disruption (10%)
+        disruption_score = 80  # Default, needs manual assessment
+
+        composite = weighted_composite((valuation_avg, quality_avg, growth_avg,
+                                        momentum_score, disruption_score), TIER3_WEIGHTS)
+
+        return pd.DataFrame({
+            'valuation_score': round_score(valuation_avg, 1),
+            'quality_score': round_score(quality_avg, 1),
+            'growth_score': round_score(growth_avg, 1),
+            'momentum_score': momentum_score,
+            'disruption_score': disruption_score,
+            'composite_score': round_score(composite, 1),
+            'rating': lookup_scores(composite, TIER3_RATING_TABLE),
+            'stop_loss_price': round_score(_column(df, 'price', 0) * TIER3_STOP_LOSS_RATIO, 2),
+        }, index=df.index)
+
+
+# (results key, console heading, scorer, display label) for each tier, in report order
+TIERS = (
+    ('tier1', "TIER 1 (CORE) STOCKS:", Tier1Scorer, 'Tier 1'),
+    ('tier2', "TIER 2 (EMERGING) STOCKS:", Tier2Scorer, 'Tier 2'),
+    ('tier3', "TIER 3 (MOONSHOTS) STOCKS:", Tier3Scorer, 'Tier 3'),
+)
+
+TIER_SCORERS = {key: scorer for key, _, scorer, _ in TIERS}
+
+# Stock data fields that are not metrics
+TEXT_FIELDS = ('symbol', 'sector', 'industry')
+
+
+def _metrics_frame(records: Iterable[Dict]) -> pd.DataFrame:
+    """One DataFrame from stock data dicts, skipping failed fetches (None)
+
+    Metric columns are converted to float64 once (None -> NaN) so every
+    batch component reads typed arrays.
+    """
+    df = pd.DataFrame([data for data in records if data])
+    if df.empty:
+        return df
+    metrics = df.columns.difference(TEXT_FIELDS)
+    df[metrics] = df[metrics].apply(pd.to_numeric, errors='coerce').astype('float64')
+    return df
+
+
+def score_portfolio(records: Iterable[Dict], tier: str) -> pd.DataFrame:
+    """Score many stocks of one tier in a single vectorized pass
+
+    records are stock data dicts (as returned by StockDataFetcher.get_stock_data);
+    tier is a TIERS key ('tier1', 'tier2' or 'tier3'). Returns the input data
+    with the score columns appended, one row per stock.
+    """
+    df = _metrics_frame(records)
+    if df.empty:
+        return df
+    return df.join(TIER_SCORERS[tier].calculate_composite_scores(df))
+
+
+def frame_records(df: pd.DataFrame) -> List[Dict]:
+    """Rows of a scored frame as plain dicts, with missing values (NaN) as None"""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+DEFAULT_WATCHLIST = {
+    'tier1': ('GOOGL', 'AAPL', 'MSFT', 'NVDA', 'META'),
+    'tier2': ('PLTR', 'SNOW', 'DDOG', 'CRWD', 'NET'),
+    'tier3': ('RKLB', 'IONQ', 'HOOD', 'SOFI', 'COIN'),
+}
+
 
 class AutomatedRater:
     """Main automation class"""
@@ -561,6 +831,7 @@ class AutomatedRater:
     def __init__(self, config_file: str = "watchlist.json"):
         self.fetcher = StockDataFetcher()
         self.config_file = config_file
+        self._watchlist = None
         self.results = {
             'tier1': [],
             'tier2': [],
@@ -569,77 +840,56 @@ class AutomatedRater:
         }
 
     def load_watchlist(self) -> Dict:
-        """Load stock watchlist from config file"""
-        try:
+        """Load stock watchlist from config file (read once per rater)"""
+        if self._watchlist is not None:
+            return self._watchlist
+
+        if os.path.exists(self.config_file):
             with open(self.config_file, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
+                self._watchlist = json.load(f)
+        else:
             # Create default watchlist
-            default = {
-                'tier1': ['GOOGL', 'AAPL', 'MSFT', 'NVDA', 'META'],
-                'tier2': ['PLTR', 'SNOW', 'DDOG', 'CRWD', 'NET'],
-                'tier3': ['RKLB', 'IONQ', 'HOOD', 'SOFI', 'COIN']
-            }
             with open(self.config_file, 'w') as f:
-                json.dump(default, f, indent=2)
+                json.dump(DEFAULT_WATCHLIST, f, indent=2)
             print(f"Created default watchlist: {self.config_file}")
-            return default
+            self._watchlist = {tier: list(symbols) for tier, symbols in DEFAULT_WATCHLIST.items()}
+
+        return self._watchlist
 
     def rate_all_stocks(self):
         """Fetch and rate all stocks in watchlist"""
         watchlist = self.load_watchlist()
 
-        print(f"\n{'='*80}")
+        print(f"\n{SEPARATOR}")
         print(f"AUTOMATED STOCK RATING - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*80}\n")
-
-        # Process Tier 1
-        print("TIER 1 (CORE) STOCKS:")
-        print("-" * 80)
-        for symbol in watchlist.get('tier1', []):
-            data = self.fetcher.get_stock_data(symbol)
-            if data:
-                scores = Tier1Scorer.calculate_composite_score(data)
-                result = {**data, **scores}
-                self.results['tier1'].append(result)
-                self._print_stock_summary(result, 'Tier 1')
-
-        print("\n" + "="*80 + "\n")
-
-        # Process Tier 2
-        print("TIER 2 (EMERGING) STOCKS:")
-        print("-" * 80)
-        for symbol in watchlist.get('tier2', []):
-            data = self.fetcher.get_stock_data(symbol)
-            if data:
-                scores = Tier2Scorer.calculate_composite_score(data)
-                result = {**data, **scores}
-                self.results['tier2'].append(result)
-                self._print_stock_summary(result, 'Tier 2')
-
-        print("\n" + "="*80 + "\n")
-
-        # Process Tier 3
-        print("TIER 3 (MOONSHOTS) STOCKS:")
-        print("-" * 80)
-        for symbol in watchlist.get('tier3', []):
-            data = self.fetcher.get_stock_data(symbol)
-            if data:
-                scores = Tier3Scorer.calculate_composite_score(data)
-                result = {**data, **scores}
-                self.results['tier3'].append(result)
-                self._print_stock_summary(result, 'Tier 3')
-
-        print("\n" + "="*80)
-
-    def _print_stock_summary(self, data: Dict, tier: str):
-        """Print formatted stock summary"""
+        print(f"{SEPARATOR}\n")
+
+        # Fetch the whole watchlist up front so the network requests overlap
+        stock_data = self.fetcher.get_many(symbol for tier, *_ in TIERS for symbol in watchlist.get(tier, []))
+
+        for i, (tier, heading, _, label) in enumerate(TIERS):
+            if i:
+                print("\n" + SEPARATOR + "\n")
+
+            # Score the whole tier column-wise in one pass, then keep per-stock records for reporting
+            scored = score_portfolio((stock_data[symbol] for symbol in watchlist.get(tier, [])), tier)
+            results = frame_records(scored)
+            self.results[tier].extend(results)
+
+            lines = [heading, SUBSEPARATOR]
+            lines.extend(self._format_stock_summary(result, label) for result in results)
+            print("\n".join(lines))
+
+        print("\n" + SEPARATOR)
+
+    def _format_stock_summary(self, data: Dict, tier: str) -> str:
+        """Format a one-line stock summary"""
         symbol = data['symbol']
         price = data.get('price', 0)
         composite = data.get('composite_score', 0)
         rating = data.get('rating', 'N/A')
 
-        print(f"{symbol:6} ${price:7.2f}  Score: {composite:5.1f}  {rating}")
+        return f"{symbol:6} ${price:7.2f}  Score: {composite:5.1f}  {rating}"
 
     def export_to_csv(self, output_dir: str = "."):
         """Export results to CSV files"""
@@ -668,93 +918,72 @@ class AutomatedRater:
         if not data:
             return
 
-        with open(filename, 'w', newline='') as f:
-            if tier == 'tier1':
-                fieldnames = ['symbol', 'price', 'market_cap', 'valuation_score', 'quality_score',
-                            'growth_score', 'momentum_score', 'financial_health_score',
-                            'composite_score', 'rating', 'forward_pe', 'peg_ratio',
-                            'revenue_growth', 'operating_margins', 'free_cash_flow']
-            elif tier == 'tier2':
-                fieldnames = ['symbol', 'price', 'market_cap', 'valuation_score', 'quality_score',
-                            'growth_score', 'momentum_score', 'moat_score', 'composite_score',
-                            'rating', 'price_to_sales', 'revenue_growth', 'gross_margins']
-            else:  # tier3
-                fieldnames = ['symbol', 'price', 'market_cap', 'valuation_score', 'quality_score',
-                            'growth_score', 'momentum_score', 'disruption_score', 'composite_score',
-                            'rating', 'stop_loss_price', 'price_to_sales', 'revenue_growth']
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(data)
+        if tier == 'tier1':
+            fieldnames = ['symbol', 'price', 'market_cap', 'valuation_score', 'quality_score',
+                        'growth_score', 'momentum_score', 'financial_health_score',
+                        'composite_score', 'rating', 'forward_pe', 'peg_ratio',
+                        'revenue_growth', 'operating_margins', 'free_cash_flow']
+        elif tier == 'tier2':
+            fieldnames = ['symbol', 'price', 'market_cap', 'valuation_score', 'quality_score',
+                        'growth_score', 'momentum_score', 'moat_score', 'composite_score',
+                        'rating', 'price_to_sales', 'revenue_growth', 'gross_margins']
+        else:  # tier3
+            fieldnames = ['symbol', 'price', 'market_cap', 'valuation_score', 'quality_score',
+                        'growth_score', 'momentum_score', 'disruption_score', 'composite_score',
+                        'rating', 'stop_loss_price', 'price_to_sales', 'revenue_growth']
+
+        # Missing fields are written as empty cells, extra fields are dropped
+        pd.DataFrame(data).reindex(columns=fieldnames).to_csv(filename, index=False)
 
     def generate_alerts(self) -> List[str]:
         """Generate alerts for action items"""
-        alerts = []
-
-        # Check for Strong Buy opportunities
-        for tier_name, stocks in [('Tier 1', self.results['tier1']),
-                                   ('Tier 2', self.results['tier2']),
-                                   ('Tier 3', self.results['tier3'])]:
-            for stock in stocks:
-                if stock['composite_score'] >= 85:
-                    alerts.append(f"⭐ {tier_name} STRONG BUY: {stock['symbol']} - Score: {stock['composite_score']}")
-
-        # Check for Sell signals
-        for tier_name, stocks in [('Tier 1', self.results['tier1']),
-                                   ('Tier 2', self.results['tier2']),
-                                   ('Tier 3', self.results['tier3'])]:
-            for stock in stocks:
-                if stock['composite_score'] < 65:
-                    alerts.append(f"⚠️  {tier_name} REVIEW: {stock['symbol']} - Score: {stock['composite_score']} ({stock['rating']})")
-
-        # Check Tier 3 stop losses
-        for stock in self.results['tier3']:
-            if 'stop_loss_price' in stock:
-                if stock['price'] <= stock['stop_loss_price']:
-                    alerts.append(f"🛑 STOP LOSS HIT: {stock['symbol']} - Price: ${stock['price']:.2f}, Stop: ${stock['stop_loss_price']:.2f}")
-
-        return alerts
+        return generate_alerts(self.results)
 
     def print_summary(self):
         """Print portfolio summary"""
-        print("\n" + "="*80)
-        print("PORTFOLIO SUMMARY")
-        print("="*80)
+        lines = [
+            "\n" + SEPARATOR,
+            "PORTFOLIO SUMMARY",
+            SEPARATOR,
+        ]
 
         total_stocks = len(self.results['tier1']) + len(self.results['tier2']) + len(self.results['tier3'])
-        print(f"\nTotal stocks rated: {total_stocks}")
-        print(f"  Tier 1 (Core): {len(self.results['tier1'])}")
-        print(f"  Tier 2 (Emerging): {len(self.results['tier2'])}")
-        print(f"  Tier 3 (Moonshots): {len(self.results['tier3'])}")
+        lines.append(f"\nTotal stocks rated: {total_stocks}")
+        lines.append(f"  Tier 1 (Core): {len(self.results['tier1'])}")
+        lines.append(f"  Tier 2 (Emerging): {len(self.results['tier2'])}")
+        lines.append(f"  Tier 3 (Moonshots): {len(self.results['tier3'])}")
 
         # Calculate average scores
         if self.results['tier1']:
-            avg_tier1 = np.mean([s['composite_score'] for s in self.results['tier1']])
-            print(f"\nAverage Tier 1 Score: {avg_tier1:.1f}")
+            avg_tier1 = sum(s['composite_score'] for s in self.results['tier1']) / len(self.results['tier1'])
+            lines.append(f"\nAverage Tier 1 Score: {avg_tier1:.1f}")
 
         if self.results['tier2']:
-            avg_tier2 = np.mean([s['composite_score'] for s in self.results['tier2']])
-            print(f"Average Tier 2 Score: {avg_tier2:.1f}")
+            avg_tier2 = sum(s['composite_score'] for s in self.results['tier2']) / len(self.results['tier2'])
+            lines.append(f"Average Tier 2 Score: {avg_tier2:.1f}")
 
         if self.results['tier3']:
-            avg_tier3 = np.mean([s['composite_score'] for s in self.results['tier3']])
-            print(f"Average Tier 3 Score: {avg_tier3:.1f}")
+            avg_tier3 = sum(s['composite_score'] for s in self.results['tier3']) / len(self.results['tier3'])
+            lines.append(f"Average Tier 3 Score: {avg_tier3:.1f}")
 
         # Print alerts
         alerts = self.generate_alerts()
         if alerts:
-            print("\n" + "="*80)
-            print("ALERTS & ACTION ITEMS")
-            print("="*80)
-            for alert in alerts:
-                print(alert)
+            lines.append("\n" + SEPARATOR)
+            lines.append("ALERTS & ACTION ITEMS")
+            lines.append(SEPARATOR)
+            lines.extend(alerts)
+
+        lines.append("\n" + SEPARATOR)
 
-        print("\n" + "="*80)
+        # Emit the whole summary in one write
+        print("\n".join(lines))
 
 
 def main():
     """Main execution function"""
-    import sys
+    # yfinance/pandas deprecation chatter drowns out the report
+    warnings.filterwarnings('ignore')
 
     print("🤖 Automated Stock Rating System")
     print("Fetching real-time data and calculating scores...")
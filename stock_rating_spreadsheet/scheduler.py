@@ -11,6 +11,8 @@ import subprocess
 import sys
 import os
 
+SEPARATOR = "=" * 80
+
 
 class StockRatingScheduler:
     """Schedule automated stock rating updates"""
@@ -20,9 +22,9 @@ class StockRatingScheduler:
 
     def run_rating_update(self):
         """Execute the rating script"""
-        print(f"\n{'='*80}")
+        print(f"\n{SEPARATOR}")
         print(f"Scheduled Rating Update - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*80}\n")
+        print(f"{SEPARATOR}\n")
 
         try:
             # Run the auto_stock_rater script
@@ -36,9 +38,9 @@ class StockRatingScheduler:
             if result.stderr:
                 print("Errors:", result.stderr)
 
-            print(f"\n{'='*80}")
+            print(f"\n{SEPARATOR}")
             print(f"Update Complete - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"{'='*80}\n")
+            print(f"{SEPARATOR}\n")
 
         except Exception as e:
             print(f"Error running scheduled update: {e}")
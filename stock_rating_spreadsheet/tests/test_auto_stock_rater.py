@@ -0,0 +1,182 @@
+"""Tests for the per-stock and batch scoring paths of auto_stock_rater"""
+
+import os
+import random
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("yfinance")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import auto_stock_rater as rater  # noqa: E402
+import dashboard_generator  # noqa: E402
+
+
+def _edges(thresholds, scale=1):
+    """Values exactly at, just below and just above each threshold, plus None"""
+    values = [None]
+    for threshold in thresholds:
+        values.extend((threshold / scale, (threshold - 0.01) / scale, (threshold + 0.01) / scale))
+    return values
+
+
+# Candidate values per stock data field, clustered around the score table thresholds
+EDGE_VALUES = {
+    'forward_pe': _edges(rater.PE_TABLE.thresholds) + [-5],
+    'peg_ratio': _edges(rater.PEG_TABLE.thresholds),
+    'price_to_sales': _edges(rater.PRICE_TO_SALES_TABLE.thresholds),
+    'operating_margins': _edges(rater.OPERATING_MARGIN_TABLE.thresholds, 100),
+    'gross_margins': _edges(rater.GROSS_MARGIN_TABLE.thresholds, 100),
+    'roe': _edges(rater.ROE_TABLE.thresholds, 100),
+    'revenue_growth': _edges(rater.REVENUE_GROWTH_TABLE.thresholds + rater.HIGH_GROWTH_REVENUE_TABLE.thresholds
+                             + rater.HYPERGROWTH_REVENUE_TABLE.thresholds, 100),
+    'earnings_growth': _edges(rater.REVENUE_GROWTH_TABLE.thresholds, 100),
+    'return_12m': _edges(rater.PRICE_MOMENTUM_TABLE.thresholds),
+    'return_6m': _edges(rater.PRICE_MOMENTUM_TABLE.thresholds + (50,)),
+    'qqq_return': [0, 5, 15, -15],
+    'market_cap': [50, 500, 2000],
+    'free_cash_flow': [-1, 0, 1, 10, 15, 15.01, 40],
+    'total_cash': [0, 25, 50, 100],
+    'total_debt': [0, 25, 50, 100],
+    'revenue': [1, 2, 2.01, 10],
+    'price': [0, 10, 100, 123.45],
+    'fifty_day_avg': [0, 10, 100],
+    'two_hundred_day_avg': [0, 10, 100],
+}
+
+# Fields the per-stock path reads without a None check
+REQUIRED_FIELDS = ('market_cap', 'free_cash_flow', 'total_cash', 'total_debt', 'revenue', 'price',
+                   'fifty_day_avg', 'two_hundred_day_avg', 'qqq_return')
+
+
+def edge_records(count, seed=0):
+    """Random stock data dicts built from EDGE_VALUES"""
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        record = {field: rng.choice(values) for field, values in EDGE_VALUES.items()}
+        for field in REQUIRED_FIELDS:
+            if record[field] is None:
+                record[field] = 0
+        if record['return_6m'] is None:
+            record['return_6m'] = 0
+        records.append(record)
+    return records
+
+
+def assert_same_scores(scalar, batch):
+    """A per-stock result dict equals the matching batch row, key by key"""
+    for key, value in scalar.items():
+        assert batch[key] == value, key
+
+
+@pytest.mark.parametrize("tier", [key for key, _, _, _ in rater.TIERS])
+def test_scalar_and_batch_scores_match_at_threshold_edges(tier):
+    scorer = rater.TIER_SCORERS[tier]
+    records = edge_records(3000)
+    batch = scorer.calculate_composite_scores(pd.DataFrame(records).astype('float64'))
+
+    composites = []
+    for record, (_, row) in zip(records, batch.iterrows()):
+        scalar = scorer.calculate_composite_score(record)
+        assert_same_scores(scalar, row)
+        composites.append(scalar['composite_score'])
+
+    # The sample reaches every rating boundary
+    thresholds = (rater.TIER3_RATING_TABLE if tier == 'tier3' else rater.RATING_TABLE).thresholds
+    for threshold in thresholds:
+        assert any(abs(composite - threshold) < 0.5 for composite in composites), threshold
+
+
+def test_round_score_rounds_like_numpy():
+    # builtin round(73.35, 1) gives 73.3; both scoring paths must agree on 73.4
+    assert rater.round_score(73.35, 1) == 73.4
+    assert rater.round_score(np.array([73.35]), 1)[0] == 73.4
+
+
+def test_weighted_composite_scalar_matches_array():
+    rng = random.Random(1)
+    for weights in (rater.TIER1_WEIGHTS, rater.TIER2_WEIGHTS, rater.TIER3_WEIGHTS):
+        rows = [[rng.choice((20, 25, 30, 40, 50, 55, 60, 70, 75, 80, 85, 90, 100)) / rng.choice((1, 2, 3))
+                 for _ in weights] for _ in range(2000)]
+        batch = rater.weighted_composite(np.array(rows).T, weights)
+        for row, composite in zip(rows, batch):
+            scalar = rater.weighted_composite(row, weights)
+            assert scalar == composite
+            assert rater.round_score(scalar, 1) == rater.round_score(composite, 1)
+
+
+# Keys StockDataFetcher.get_stock_data leaves out when history or the benchmark is unavailable
+OPTIONAL_FIELDS = ('return_12m', 'return_6m', 'qqq_return', 'fifty_day_avg', 'two_hundred_day_avg')
+
+
+def fetched_records(count, seed=0):
+    """Stock data dicts shaped like StockDataFetcher.get_stock_data output"""
+    rng = random.Random(seed)
+    records = {}
+    for i, record in enumerate(edge_records(count, seed)):
+        record['symbol'] = f"S{i}"
+        record['sector'] = record['industry'] = 'Unknown'
+        for field in OPTIONAL_FIELDS:
+            if rng.random() < 0.3:
+                del record[field]
+        records[record['symbol']] = record
+    records['FAILED'] = None
+    return records
+
+
+class StubFetcher:
+    def __init__(self, records):
+        self.records = records
+
+    def get_many(self, symbols):
+        return {symbol: self.records[symbol] for symbol in symbols}
+
+
+def test_rate_all_stocks_matches_per_stock_scores(capsys):
+    records = fetched_records(600)
+    symbols = list(records)
+    automated = rater.AutomatedRater()
+    automated.fetcher = StubFetcher(records)
+    automated._watchlist = {'tier1': symbols[:200] + ['FAILED'], 'tier2': symbols[200:400],
+                            'tier3': symbols[400:600]}
+
+    automated.rate_all_stocks()
+
+    for tier, _, scorer, _ in rater.TIERS:
+        expected = [{**records[symbol], **scorer.calculate_composite_score(records[symbol])}
+                    for symbol in automated._watchlist[tier] if records[symbol]]
+        results = automated.results[tier]
+        assert len(results) == len(expected)
+        for result, data in zip(results, expected):
+            assert_same_scores(data, result)
+            # Fields this stock lacks but others in the tier have come back as None
+            assert all(result[key] is None for key in result.keys() - data.keys())
+
+
+def test_generate_alerts_groups_by_kind():
+    results = {
+        'tier1': [{'symbol': 'AAA', 'composite_score': 88.2, 'rating': 'Strong Buy ⭐⭐⭐⭐⭐', 'price': 100.0},
+                  {'symbol': 'BBB', 'composite_score': 60.0, 'rating': 'Reduce ⭐⭐', 'price': 100.0}],
+        'tier2': [{'symbol': 'CCC', 'composite_score': 75.0, 'rating': 'Buy ⭐⭐⭐⭐', 'price': 100.0}],
+        'tier3': [{'symbol': 'DDD', 'composite_score': 86.0, 'rating': 'Strong Buy ⭐⭐⭐⭐⭐', 'price': 10.0,
+                   'stop_loss_price': 12.5},
+                  {'symbol': 'EEE', 'composite_score': 70.0, 'rating': 'Hold ⭐⭐⭐', 'price': 20.0,
+                   'stop_loss_price': 12.0}],
+    }
+
+    assert dashboard_generator.generate_alerts(results) == [
+        "⭐ Tier 1 STRONG BUY: AAA - Score: 88.2",
+        "⭐ Tier 3 STRONG BUY: DDD - Score: 86.0",
+        "⚠️  Tier 1 REVIEW: BBB - Score: 60.0 (Reduce ⭐⭐)",
+        "🛑 STOP LOSS HIT: DDD - Price: $10.00, Stop: $12.50",
+    ]
+
+    automated = rater.AutomatedRater()
+    automated.results.update(results)
+    assert automated.generate_alerts() == dashboard_generator.generate_alerts(results)
+